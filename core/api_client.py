@@ -2,31 +2,243 @@
 API Client for DMX Visualizer
 """
 
+import copy
+import json
+import os
+import threading
+
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Prefer msgpack bodies when the server can produce them
+_MSGPACK_ACCEPT = 'application/msgpack, application/json;q=0.5'
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+
+class APIError(Exception):
+    """Raised when a request to the DMX Visualizer API fails."""
+
+
+# Transport and HTTP status errors of the session backends, re-raised as APIError
+_BACKEND_ERRORS = (requests.RequestException,)
+if HTTPX_AVAILABLE:
+    _BACKEND_ERRORS += (httpx.HTTPError,)
 
 
 class APIClient:
-    def __init__(self, base_url: str = "http://localhost:8082"):
-        self.base_url = base_url.rstrip('/')
+    __slots__ = (
+        'base_url', 'timeout', '_session', '_http2', '_api_root', '_preview_url',
+        '_gobo_url_cache', '_etag_cache', '_msgpack_ok', '_simdjson_parser', '_parser_lock',
+    )
+
+    def __init__(self, base_url: str = "http://localhost:8082", http2: bool = False):
         self.timeout = 5
+        self.set_base_url(base_url)
+
+        # Reused simdjson parser for list responses (not thread-safe, so locked)
+        self._simdjson_parser = simdjson.Parser() if SIMDJSON_AVAILABLE else None
+        self._parser_lock = threading.Lock()
+
+        self._http2 = False
+        self._session = self._create_session(http2)
+
+    def _create_session(self, http2: bool) -> Any:
+        """Create the pooled HTTP session used for all requests."""
+        if http2 and HTTPX_AVAILABLE:
+            # HTTP/2 multiplexes concurrent requests over one connection
+            try:
+                client = httpx.Client(
+                    http2=True,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                    headers={'Accept': 'application/json'},
+                )
+                self._http2 = True
+                return client
+            except ImportError:
+                pass  # h2 package missing, fall back to requests
+
+        # Persistent session so connections are pooled and kept alive
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        return session
 
     def set_base_url(self, url: str):
         """Update the base URL."""
         self.base_url = url.rstrip('/')
+        self._api_root = self.base_url + '/api/v1'
+        self._preview_url = self._api_root + '/status/preview'
+        # Full-size URLs keyed by gobo id, thumbnail URLs by (gobo id, size)
+        self._gobo_url_cache: Dict[Union[int, Tuple[int, int]], str] = {}
+        # (method, endpoint, key) -> (ETag, parsed body) for conditional GETs
+        self._etag_cache: Dict[tuple, tuple] = {}
+        # Whether this server answers with msgpack; None until the first reply
+        self._msgpack_ok = None
+
+    @property
+    def api_root(self) -> str:
+        """Base URL of the versioned API."""
+        return self._api_root
+
+    @property
+    def preview_url(self) -> str:
+        """Preview image URL; rebuilt only by set_base_url."""
+        return self._preview_url
+
+    def ping(self, timeout: float = 1.0) -> bool:
+        """Check the server is reachable with a HEAD request on the pooled session."""
+        try:
+            response = self._session.head(self._api_root + '/status', timeout=timeout)
+        except Exception:
+            return False
+        # Any non-5xx answer (including 405 from servers without HEAD) means it is up
+        return response.status_code < 500
+
+    def close(self):
+        """Close pooled connections."""
+        self._session.close()
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send an API request and return the raw (requests or httpx) response.
+
+        Raises APIError on connection failures and HTTP error statuses.
+        """
+        url = self._api_root + endpoint
+        kwargs.setdefault('timeout', self.timeout)
+
+        try:
+            response = self._session.request(method, url, **kwargs)
+            # httpx treats 304 as an error; it is the normal reply to If-None-Match
+            if response.status_code != 304:
+                response.raise_for_status()
+        except _BACKEND_ERRORS as e:
+            raise APIError(f"{method} {endpoint} failed: {e}") from e
+        return response
 
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make an API request."""
-        url = f"{self.base_url}/api/v1{endpoint}"
-        kwargs.setdefault('timeout', self.timeout)
+        return self._fetch(method, endpoint, None, **kwargs)
+
+    def _request_key(self, method: str, endpoint: str, key: str, **kwargs) -> List[Any]:
+        """Make an API request and return only one top-level list from the response."""
+        return self._fetch(method, endpoint, key, **kwargs)
+
+    def _fetch(self, method: str, endpoint: str, key: Optional[str], **kwargs) -> Any:
+        """Send a request and parse the body, reusing the last result on 304 Not Modified."""
+        cache_key = (method, endpoint, key)
+        cached = self._etag_cache.get(cache_key) if method == 'GET' else None
+        offer_msgpack = MSGPACK_AVAILABLE and self._msgpack_ok is not False
+
+        headers = dict(kwargs.get('headers') or {})
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        if offer_msgpack:
+            headers.setdefault('Accept', _MSGPACK_ACCEPT)
+        if headers:
+            kwargs['headers'] = headers
+
+        response = self._send(method, endpoint, **kwargs)
+        if cached is not None and response.status_code == 304:
+            # Callers get their own top-level list/dict so in-place edits
+            # (sorting, filtering) can't reach the cached copy
+            return copy.copy(cached[1])
+
+        if offer_msgpack and 'msgpack' in response.headers.get('Content-Type', ''):
+            self._msgpack_ok = True
+            data = msgpack.unpackb(response.content, raw=False) if response.content else {}
+            parsed = data if key is None else data.get(key, [])
+        else:
+            if offer_msgpack and response.content:
+                # Server ignored the msgpack offer, stop negotiating
+                self._msgpack_ok = False
+            if key is None:
+                parsed = self._parse(response.content)
+            else:
+                parsed = self._parse_key(response.content, key)
 
-        response = requests.request(method, url, **kwargs)
-        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        if method == 'GET' and etag:
+            self._etag_cache[cache_key] = (etag, parsed)
+            return copy.copy(parsed)
+        return parsed
 
-        if response.content:
-            return response.json()
+    def _parse(self, content: bytes) -> Dict[str, Any]:
+        """Decode a JSON response body."""
+        if content:
+            return _json_loads(content)
         return {}
 
+    def _parse_key(self, content: bytes, key: str) -> List[Any]:
+        """Decode only one top-level list from a JSON response body."""
+        if not content:
+            return []
+        if self._simdjson_parser is None:
+            return _json_loads(content).get(key, [])
+
+        with self._parser_lock:
+            doc = self._simdjson_parser.parse(content)
+            value = doc.get(key) if isinstance(doc, simdjson.Object) else None
+            result = value.as_list() if isinstance(value, simdjson.Array) else []
+            # Proxies must be released before the parser is reused
+            del doc, value
+        return result
+
+    def _upload(self, endpoint: str, file_path: str,
+                fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Upload a file as multipart form data, streaming it from disk when possible."""
+        parts = {key: str(value) for key, value in (fields or {}).items()}
+        with open(file_path, 'rb') as f:
+            if self._http2 or not TOOLBELT_AVAILABLE:
+                # httpx streams multipart file bodies on its own
+                return self._request('POST', endpoint, files={'file': f}, data=parts)
+
+            parts['file'] = (os.path.basename(file_path), f, 'application/octet-stream')
+            encoder = MultipartEncoder(parts)
+            return self._request('POST', endpoint, data=encoder,
+                                 headers={'Content-Type': encoder.content_type})
+
     # Status
     def get_status(self) -> Dict[str, Any]:
         """Get system status."""
@@ -34,18 +246,16 @@ class APIClient:
 
     def get_preview_url(self) -> str:
         """Get the preview image URL."""
-        return f"{self.base_url}/api/v1/status/preview"
+        return self._preview_url
 
     # Outputs
     def get_outputs(self) -> List[Dict[str, Any]]:
         """Get all outputs."""
-        data = self._request('GET', '/outputs')
-        return data.get('outputs', [])
+        return self._request_key('GET', '/outputs', 'outputs')
 
     def get_displays(self) -> List[Dict[str, Any]]:
         """Get available displays."""
-        data = self._request('GET', '/displays')
-        return data.get('displays', [])
+        return self._request_key('GET', '/displays', 'displays')
 
     def add_display_output(self, display_id: str) -> Dict[str, Any]:
         """Add a display output."""
@@ -74,19 +284,26 @@ class APIClient:
     # Gobos
     def get_gobos(self) -> List[Dict[str, Any]]:
         """Get all gobos."""
-        data = self._request('GET', '/gobos')
-        return data.get('gobos', [])
+        return self._request_key('GET', '/gobos', 'gobos')
 
     def get_gobo_image_url(self, gobo_id: int) -> str:
         """Get the URL for a gobo image."""
-        return f"{self.base_url}/api/v1/gobos/{gobo_id}/image"
+        url = self._gobo_url_cache.get(gobo_id)
+        if url is None:
+            url = self._gobo_url_cache[gobo_id] = f"{self._api_root}/gobos/{gobo_id}/image"
+        return url
+
+    def get_gobo_thumbnail_url(self, gobo_id: int, size: int = 80) -> str:
+        """Get the URL for a gobo image downscaled to fit size x size."""
+        key = (gobo_id, size)
+        url = self._gobo_url_cache.get(key)
+        if url is None:
+            url = self._gobo_url_cache[key] = f"{self._api_root}/gobos/{gobo_id}/image?size={size}"
+        return url
 
     def upload_gobo(self, slot: int, file_path: str) -> Dict[str, Any]:
         """Upload a gobo to a slot."""
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            data = {'slot': slot}
-            return self._request('POST', '/gobos/upload', files=files, data=data)
+        return self._upload('/gobos/upload', file_path, {'slot': slot})
 
     def delete_gobo(self, slot: int) -> Dict[str, Any]:
         """Delete a gobo from a slot."""
@@ -95,30 +312,23 @@ class APIClient:
     # Media Slots
     def get_media_slots(self) -> List[Dict[str, Any]]:
         """Get all media slots."""
-        data = self._request('GET', '/media/slots')
-        return data.get('slots', [])
+        return self._request_key('GET', '/media/slots', 'slots')
 
     def get_videos(self) -> List[Dict[str, Any]]:
         """Get available videos."""
-        data = self._request('GET', '/media/videos')
-        return data.get('videos', [])
+        return self._request_key('GET', '/media/videos', 'videos')
 
     def get_images(self) -> List[Dict[str, Any]]:
         """Get available images."""
-        data = self._request('GET', '/media/images')
-        return data.get('images', [])
+        return self._request_key('GET', '/media/images', 'images')
 
     def upload_video(self, file_path: str) -> Dict[str, Any]:
         """Upload a video."""
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            return self._request('POST', '/media/videos/upload', files=files)
+        return self._upload('/media/videos/upload', file_path)
 
     def upload_image(self, file_path: str) -> Dict[str, Any]:
         """Upload an image."""
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            return self._request('POST', '/media/images/upload', files=files)
+        return self._upload('/media/images/upload', file_path)
 
     def assign_media_slot(self, slot: int, source: str) -> Dict[str, Any]:
         """Assign media to a slot."""
@@ -131,8 +341,7 @@ class APIClient:
     # NDI Sources
     def get_ndi_sources(self) -> List[Dict[str, Any]]:
         """Get NDI sources."""
-        data = self._request('GET', '/ndi/sources')
-        return data.get('sources', [])
+        return self._request_key('GET', '/ndi/sources', 'sources')
 
     def refresh_ndi_sources(self) -> Dict[str, Any]:
         """Refresh NDI source discovery."""
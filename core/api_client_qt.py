@@ -0,0 +1,121 @@
+"""
+Qt API Client for DMX Visualizer - non-blocking requests for the GUI thread
+"""
+
+import json
+from functools import partial
+from typing import Optional, Dict, Any, Callable
+
+from PyQt5.QtCore import QObject, QUrl, QByteArray
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+
+class QtAPIClient(QObject):
+    """Non-blocking API client for the GUI thread; URLs follow the wrapped APIClient."""
+
+    def __init__(self, api, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.nam = QNetworkAccessManager(self)  # Shared by the views for their own downloads
+
+    def _request(self, endpoint: str, timeout: Optional[float] = None) -> QNetworkRequest:
+        """Build a request for an API endpoint."""
+        request = QNetworkRequest(QUrl(self.api.api_root + endpoint))
+        request.setRawHeader(b'Accept', b'application/json')
+        request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        request.setTransferTimeout(int((timeout or self.api.timeout) * 1000))
+        return request
+
+    def _send(self, method: bytes, endpoint: str, body: Optional[Dict[str, Any]] = None,
+              callback: Optional[Callable] = None, error_callback: Optional[Callable] = None,
+              key: Optional[str] = None) -> QNetworkReply:
+        """Issue a request; callback receives the decoded JSON (or one key of it)."""
+        request = self._request(endpoint)
+
+        if body is not None:
+            request.setHeader(QNetworkRequest.ContentTypeHeader, 'application/json')
+            reply = self.nam.sendCustomRequest(request, method, QByteArray(_json_dumps(body)))
+        elif method == b'GET':
+            reply = self.nam.get(request)
+        else:
+            reply = self.nam.sendCustomRequest(request, method)
+
+        reply.finished.connect(partial(self._on_finished, reply, callback, error_callback, key))
+        return reply
+
+    def _on_finished(self, reply, callback, error_callback, key):
+        """Decode a finished reply and dispatch it to the caller's callbacks."""
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NoError:
+            if error_callback:
+                error_callback(reply.errorString())
+            return
+
+        content = bytes(reply.readAll())
+        try:
+            data = _json_loads(content) if content else {}
+        except ValueError as e:
+            if error_callback:
+                error_callback(str(e))
+            return
+
+        if callback:
+            callback(data.get(key, []) if key else data)
+
+    # Status
+    def ping(self, callback: Callable, timeout: float = 1.0) -> QNetworkReply:
+        """Check the server is reachable with a HEAD request; callback receives a bool."""
+        reply = self.nam.head(self._request('/status', timeout))
+        reply.finished.connect(partial(self._on_ping_finished, reply, callback))
+        return reply
+
+    def _on_ping_finished(self, reply, callback):
+        """Report any non-5xx HTTP answer as the server being up."""
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        callback(status is not None and status < 500)
+
+    def get_status(self, callback: Callable, error_callback: Optional[Callable] = None):
+        """Get system status."""
+        return self._send(b'GET', '/status', callback=callback, error_callback=error_callback)
+
+    # Outputs
+    def get_outputs(self, callback: Callable, error_callback: Optional[Callable] = None):
+        """Get all outputs."""
+        return self._send(b'GET', '/outputs', callback=callback,
+                          error_callback=error_callback, key='outputs')
+
+    def enable_output(self, output_id: int, callback: Optional[Callable] = None,
+                      error_callback: Optional[Callable] = None):
+        """Enable an output."""
+        return self._send(b'PUT', f'/outputs/{output_id}/enable',
+                          callback=callback, error_callback=error_callback)
+
+    def disable_output(self, output_id: int, callback: Optional[Callable] = None,
+                       error_callback: Optional[Callable] = None):
+        """Disable an output."""
+        return self._send(b'PUT', f'/outputs/{output_id}/disable',
+                          callback=callback, error_callback=error_callback)
+
+    def delete_output(self, output_id: int, callback: Optional[Callable] = None,
+                      error_callback: Optional[Callable] = None):
+        """Delete an output."""
+        return self._send(b'DELETE', f'/outputs/{output_id}',
+                          callback=callback, error_callback=error_callback)
+
+    def update_output_settings(self, output_id: int, settings: Dict[str, Any],
+                               callback: Optional[Callable] = None,
+                               error_callback: Optional[Callable] = None):
+        """Update output settings."""
+        return self._send(b'PUT', f'/outputs/{output_id}/settings', body=settings,
+                          callback=callback, error_callback=error_callback)
@@ -0,0 +1,53 @@
+"""
+API Worker - run blocking APIClient calls on the Qt thread pool
+"""
+
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _WorkerSignals(QObject):
+    """Signals for ApiWorker; QRunnable is not a QObject and cannot emit."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class ApiWorker(QRunnable):
+    """Call fn on a pool thread; callbacks are delivered on the GUI thread."""
+
+    # Started workers, kept alive until their result has been delivered
+    _active = set()
+
+    def __init__(self, fn: Callable, callback: Optional[Callable] = None,
+                 error_callback: Optional[Callable] = None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.signals = _WorkerSignals()
+        if callback:
+            self.signals.finished.connect(callback)
+        if error_callback:
+            self.signals.failed.connect(error_callback)
+        self.signals.finished.connect(self._release)
+        self.signals.failed.connect(self._release)
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+    def _release(self, _):
+        ApiWorker._active.discard(self)
+
+    @classmethod
+    def start(cls, fn: Callable, callback: Optional[Callable] = None,
+              error_callback: Optional[Callable] = None) -> 'ApiWorker':
+        """Create a worker and queue it on the global thread pool."""
+        worker = cls(fn, callback, error_callback)
+        cls._active.add(worker)
+        QThreadPool.globalInstance().start(worker)
+        return worker
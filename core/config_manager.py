@@ -2,14 +2,104 @@
 Config Manager - Handle app configuration and gamepad profiles
 """
 
+import copy
 import os
 import json
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bump when the built-in gamepad profiles change so they get written again
+_DEFAULTS_VERSION = 1
+
+# Top-level config.json key for internal bookkeeping, kept apart from the settings
+_META_KEY = '_meta'
+
+# Button layout shared by all built-in profiles
+# (PlayStation: 0=Cross, 1=Circle, 2=Square, 3=Triangle, 4=L1, 5=R1,
+#  6=L2, 7=R2, 8=Share, 9=Options)
+_COMMON_BUTTONS = MappingProxyType({
+    '0': 'select',
+    '1': 'back',
+    '2': 'refresh',
+    '3': 'context',
+    '4': 'prev_tab',
+    '5': 'next_tab',
+    '6': 'modifier',
+    '7': 'none',
+    '8': 'reset',
+    '9': 'save',
+    '12': 'nav_up',
+    '13': 'nav_down',
+    '14': 'nav_left',
+    '15': 'nav_right',
+})
+
+_DEFAULT_PROFILES = MappingProxyType({
+    'default': {
+        'name': 'Default (Steam Deck)',
+        'buttons': dict(_COMMON_BUTTONS),
+        'analog': {
+            'deadzone': 0.2,
+            'sensitivity': 1.0,
+            'invert_y': False,
+        },
+    },
+    'xbox': {
+        'name': 'Xbox Controller',
+        'buttons': dict(_COMMON_BUTTONS),
+        'analog': {
+            'deadzone': 0.15,
+            'sensitivity': 1.0,
+            'invert_y': False,
+        },
+    },
+    'playstation': {
+        'name': 'PlayStation Controller',
+        'buttons': dict(_COMMON_BUTTONS),
+        'analog': {
+            'deadzone': 0.2,
+            'sensitivity': 1.0,
+            'invert_y': False,
+        },
+    },
+})
+
+
+def _read_json(path: str) -> Any:
+    """Read and parse a JSON file."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, obj: Any):
+    """Write an object to a JSON file with 2-space indentation."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
 
 
 class ConfigManager:
     """Manages application configuration and gamepad profiles."""
 
+    __slots__ = (
+        'config_dir', 'config_file', 'profiles_dir', '_config', '_meta', '_dirty',
+        '_flush_timer', '_profile_cache', '_merged_settings',
+        '__weakref__',  # Qt holds bound-method slots (flush) by weak reference
+    )
+
     DEFAULT_CONFIG = {
         'server_url': 'http://localhost:8082',
         'auto_connect': True,
@@ -17,13 +107,28 @@ class ConfigManager:
         'active_profile': 'default',
     }
 
+    # Quiet period before coalesced config changes are written
+    SAVE_DELAY_MS = 250
+
     def __init__(self):
         self.config_dir = os.path.expanduser('~/.config/dmx-visualizer-control')
         self.config_file = os.path.join(self.config_dir, 'config.json')
         self.profiles_dir = os.path.join(self.config_dir, 'profiles')
 
+        self._dirty = False
+        self._flush_timer = None
+        # Parsed profiles keyed by name, with the file mtime they were read at
+        self._profile_cache: Dict[str, tuple] = {}
+        # Read-only view of defaults merged with config, rebuilt after changes
+        self._merged_settings = None
+
         self._ensure_dirs()
         self._config = self._load_config()
+        self._meta = self._config.pop(_META_KEY, None) or {}
+        # Older builds kept the defaults marker among the settings
+        legacy_version = self._config.pop('_defaults_version', None)
+        if legacy_version is not None:
+            self._meta.setdefault('defaults_version', legacy_version)
         self._create_default_profiles()
 
     def _ensure_dirs(self):
@@ -35,18 +140,39 @@ class ConfigManager:
         """Load configuration from file."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    # Merge with defaults for any missing keys
-                    return {**self.DEFAULT_CONFIG, **config}
-            except (json.JSONDecodeError, IOError):
+                config = _read_json(self.config_file)
+                # Merge with defaults for any missing keys
+                return {**self.DEFAULT_CONFIG, **config}
+            except (ValueError, OSError):
                 pass
         return dict(self.DEFAULT_CONFIG)
 
     def _save_config(self):
         """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self._config, f, indent=2)
+        self._dirty = False
+        # Write to a temp file first so a crash never leaves a truncated config
+        tmp_path = self.config_file + '.tmp'
+        _write_json(tmp_path, {**self._config, _META_KEY: self._meta} if self._meta else self._config)
+        os.replace(tmp_path, self.config_file)
+
+    def _schedule_save(self):
+        """Coalesce rapid config changes into a single write."""
+        self._dirty = True
+        if QCoreApplication.instance() is None:
+            # No event loop to drive the timer, write straight away
+            self._save_config()
+            return
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start(self.SAVE_DELAY_MS)
+
+    def flush(self):
+        """Write any pending config changes to disk."""
+        if self._dirty:
+            self._save_config()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value."""
@@ -55,7 +181,8 @@ class ConfigManager:
     def set(self, key: str, value: Any):
         """Set a config value."""
         self._config[key] = value
-        self._save_config()
+        self._merged_settings = None
+        self._schedule_save()
 
     def get_all(self) -> Dict[str, Any]:
         """Get all config values."""
@@ -65,94 +192,24 @@ class ConfigManager:
 
     def _create_default_profiles(self):
         """Create default gamepad profiles if they don't exist."""
-        defaults = {
-            'default': {
-                'name': 'Default (Steam Deck)',
-                'buttons': {
-                    '0': 'select',
-                    '1': 'back',
-                    '2': 'refresh',
-                    '3': 'context',
-                    '4': 'prev_tab',
-                    '5': 'next_tab',
-                    '6': 'modifier',
-                    '7': 'none',
-                    '8': 'reset',
-                    '9': 'save',
-                    '12': 'nav_up',
-                    '13': 'nav_down',
-                    '14': 'nav_left',
-                    '15': 'nav_right',
-                },
-                'analog': {
-                    'deadzone': 0.2,
-                    'sensitivity': 1.0,
-                    'invert_y': False,
-                },
-            },
-            'xbox': {
-                'name': 'Xbox Controller',
-                'buttons': {
-                    '0': 'select',
-                    '1': 'back',
-                    '2': 'refresh',
-                    '3': 'context',
-                    '4': 'prev_tab',
-                    '5': 'next_tab',
-                    '6': 'modifier',
-                    '7': 'none',
-                    '8': 'reset',
-                    '9': 'save',
-                    '12': 'nav_up',
-                    '13': 'nav_down',
-                    '14': 'nav_left',
-                    '15': 'nav_right',
-                },
-                'analog': {
-                    'deadzone': 0.15,
-                    'sensitivity': 1.0,
-                    'invert_y': False,
-                },
-            },
-            'playstation': {
-                'name': 'PlayStation Controller',
-                'buttons': {
-                    '0': 'select',      # Cross
-                    '1': 'back',        # Circle
-                    '2': 'refresh',     # Square
-                    '3': 'context',     # Triangle
-                    '4': 'prev_tab',    # L1
-                    '5': 'next_tab',    # R1
-                    '6': 'modifier',    # L2
-                    '7': 'none',        # R2
-                    '8': 'reset',       # Share
-                    '9': 'save',        # Options
-                    '12': 'nav_up',
-                    '13': 'nav_down',
-                    '14': 'nav_left',
-                    '15': 'nav_right',
-                },
-                'analog': {
-                    'deadzone': 0.2,
-                    'sensitivity': 1.0,
-                    'invert_y': False,
-                },
-            },
-        }
-
-        for name, profile in defaults.items():
+        if self._meta.get('defaults_version') == _DEFAULTS_VERSION:
+            return
+
+        for name, profile in _DEFAULT_PROFILES.items():
             profile_path = os.path.join(self.profiles_dir, f'{name}.json')
             if not os.path.exists(profile_path):
-                with open(profile_path, 'w') as f:
-                    json.dump(profile, f, indent=2)
+                _write_json(profile_path, profile)
+
+        self._meta['defaults_version'] = _DEFAULTS_VERSION
+        self._schedule_save()
 
     def get_profile_list(self) -> List[str]:
         """Get list of available profile names."""
-        profiles = []
-        for filename in os.listdir(self.profiles_dir):
-            if filename.endswith('.json'):
-                profiles.append(filename[:-5])
-        return sorted(profiles)
+        with os.scandir(self.profiles_dir) as entries:
+            return sorted(
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            )
 
     def get_gamepad_profile(self, name: str = None) -> Optional[Dict[str, Any]]:
         """Load a gamepad profile."""
@@ -160,28 +217,37 @@ class ConfigManager:
             name = self._config.get('active_profile', 'default')
 
         profile_path = os.path.join(self.profiles_dir, f'{name}.json')
-        if os.path.exists(profile_path):
+        try:
+            mtime = os.stat(profile_path).st_mtime
+        except OSError:
+            return None
+
+        cached = self._profile_cache.get(name)
+        if cached is None or cached[0] != mtime:
             try:
-                with open(profile_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return None
+                cached = (mtime, _read_json(profile_path))
+            except (ValueError, OSError):
+                return None
+            self._profile_cache[name] = cached
+
+        # Hand out a copy so callers can't mutate the cached profile
+        return copy.deepcopy(cached[1])
 
     def save_gamepad_profile(self, name: str, profile: Dict[str, Any]):
         """Save a gamepad profile."""
         profile_path = os.path.join(self.profiles_dir, f'{name}.json')
-        with open(profile_path, 'w') as f:
-            json.dump(profile, f, indent=2)
+        _write_json(profile_path, profile)
+        self._profile_cache.pop(name, None)
 
     def delete_gamepad_profile(self, name: str) -> bool:
         """Delete a gamepad profile."""
-        if name in ('default', 'xbox', 'playstation'):
+        if name in _DEFAULT_PROFILES:
             return False  # Don't delete built-in profiles
 
         profile_path = os.path.join(self.profiles_dir, f'{name}.json')
         if os.path.exists(profile_path):
             os.remove(profile_path)
+            self._profile_cache.pop(name, None)
             return True
         return False
 
@@ -197,20 +263,18 @@ class ConfigManager:
         """Export a profile to a file."""
         profile = self.get_gamepad_profile(name)
         if profile:
-            with open(export_path, 'w') as f:
-                json.dump(profile, f, indent=2)
+            _write_json(export_path, profile)
             return True
         return False
 
     def import_profile(self, import_path: str, name: str) -> bool:
         """Import a profile from a file."""
         try:
-            with open(import_path, 'r') as f:
-                profile = json.load(f)
+            profile = _read_json(import_path)
             profile['name'] = name
             self.save_gamepad_profile(name, profile)
             return True
-        except (json.JSONDecodeError, IOError):
+        except (ValueError, OSError):
             return False
 
     # App Settings
@@ -228,20 +292,23 @@ class ConfigManager:
         'gamepad_poll_rate': 50,
         'debug_mode': False,
         'preview_quality': 'medium',
+        'http2': False,
     }
 
-    def get_app_settings(self) -> Dict[str, Any]:
-        """Get all app settings."""
-        settings = dict(self.DEFAULT_APP_SETTINGS)
-        settings.update(self._config)
-        return settings
+    def get_app_settings(self) -> Mapping[str, Any]:
+        """Get all app settings (read-only)."""
+        if self._merged_settings is None:
+            self._merged_settings = MappingProxyType({**self.DEFAULT_APP_SETTINGS, **self._config})
+        return self._merged_settings
 
     def save_app_settings(self, settings: Dict[str, Any]):
         """Save app settings."""
         self._config.update(settings)
+        self._merged_settings = None
         self._save_config()
 
     def reset_app_settings(self):
         """Reset app settings to defaults."""
         self._config = dict(self.DEFAULT_APP_SETTINGS)
+        self._merged_settings = None
         self._save_config()
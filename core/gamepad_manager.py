@@ -2,10 +2,8 @@
 Gamepad Manager - Handle gamepad input with configurable mappings
 """
 
-import json
-import os
-from typing import Optional, Dict, Any, Callable
-from PyQt5.QtCore import QObject, QThread, pyqtSignal, QTimer
+from typing import Optional, Dict, Any
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 
 try:
     import pygame
@@ -14,8 +12,24 @@ except ImportError:
     PYGAME_AVAILABLE = False
 
 
+# Map hat directions to virtual button indices
+# 12=up, 13=down, 14=left, 15=right
+_HAT_TO_BUTTON = {
+    (0, 1): 12,   # Up
+    (0, -1): 13,  # Down
+    (-1, 0): 14,  # Left
+    (1, 0): 15,   # Right
+    (1, 1): 12,   # Up-Right (emit up)
+    (-1, 1): 12,  # Up-Left (emit up)
+    (1, -1): 13,  # Down-Right (emit down)
+    (-1, -1): 13, # Down-Left (emit down)
+}
+
+_AXIS_NAMES = ('left_x', 'left_y', 'right_x', 'right_y')
+
+
 class GamepadWorker(QThread):
-    """Worker thread for polling gamepad input."""
+    """Worker thread for reading gamepad input events."""
 
     button_pressed = pyqtSignal(int)  # Button index
     button_released = pyqtSignal(int)
@@ -27,89 +41,96 @@ class GamepadWorker(QThread):
         super().__init__()
         self.running = False
         self.joystick = None
-        self.last_button_states = {}
         self.last_hat_state = (0, 0)
         self.deadzone = 0.2
+        self._last_axis = [0.0] * 8  # Last emitted (quantized) value per axis
 
     def run(self):
-        """Main polling loop."""
+        """Main event loop."""
         if not PYGAME_AVAILABLE:
             return
 
         pygame.init()
         pygame.joystick.init()
 
+        # Only queue the joystick events handled below, so every wakeup is useful
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+            pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+            pygame.JOYAXISMOTION, pygame.JOYHATMOTION,
+        ])
+
         self.running = True
 
         while self.running:
-            pygame.event.pump()
-
-            # Check for joystick connection
-            joystick_count = pygame.joystick.get_count()
-
-            if joystick_count > 0 and self.joystick is None:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-                self.connected.emit(self.joystick.get_name())
-
-            elif joystick_count == 0 and self.joystick is not None:
-                self.joystick = None
-                self.disconnected.emit()
-
-            # Poll input if connected
-            if self.joystick:
-                # Buttons
-                for i in range(self.joystick.get_numbuttons()):
-                    pressed = self.joystick.get_button(i)
-                    was_pressed = self.last_button_states.get(i, False)
-
-                    if pressed and not was_pressed:
-                        self.button_pressed.emit(i)
-                    elif not pressed and was_pressed:
-                        self.button_released.emit(i)
-
-                    self.last_button_states[i] = pressed
-
-                # Axes
-                for i in range(self.joystick.get_numaxes()):
-                    value = self.joystick.get_axis(i)
-                    if abs(value) > self.deadzone:
-                        self.axis_moved.emit(i, value)
-
-                # D-Pad (hat) - convert to button events
-                for i in range(self.joystick.get_numhats()):
-                    hat = self.joystick.get_hat(i)
-                    # hat = (x, y) where x: -1=left, 1=right, y: -1=down, 1=up
-
-                    # Map hat directions to virtual button indices
-                    # 12=up, 13=down, 14=left, 15=right
-                    hat_buttons = {
-                        (0, 1): 12,   # Up
-                        (0, -1): 13,  # Down
-                        (-1, 0): 14,  # Left
-                        (1, 0): 15,   # Right
-                        (1, 1): 12,   # Up-Right (emit up)
-                        (-1, 1): 12,  # Up-Left (emit up)
-                        (1, -1): 13,  # Down-Right (emit down)
-                        (-1, -1): 13, # Down-Left (emit down)
-                    }
-
-                    # Check if hat state changed
-                    if hat != self.last_hat_state:
-                        # Release old direction
-                        if self.last_hat_state in hat_buttons:
-                            self.button_released.emit(hat_buttons[self.last_hat_state])
-
-                        # Press new direction
-                        if hat in hat_buttons:
-                            self.button_pressed.emit(hat_buttons[hat])
-
-                        self.last_hat_state = hat
-
-            self.msleep(16)  # ~60 Hz polling
+            # Sleep until input arrives; the timeout keeps stop() responsive
+            event = pygame.event.wait(16)
+            if event.type != pygame.NOEVENT:
+                self._handle_event(event)
+            for event in pygame.event.get():
+                self._handle_event(event)
 
         pygame.quit()
 
+    def _adopt(self, device_index):
+        """Make the pad at device_index the active one."""
+        self.joystick = pygame.joystick.Joystick(device_index)
+        self.joystick.init()
+        self._last_axis = [0.0] * max(8, self.joystick.get_numaxes())
+        self.connected.emit(self.joystick.get_name())
+
+    def _handle_event(self, event):
+        """Translate a pygame joystick event into worker signals."""
+        # Connection changes (already-attached pads also report JOYDEVICEADDED)
+        if event.type == pygame.JOYDEVICEADDED:
+            if self.joystick is None:
+                self._adopt(event.device_index)
+            return
+
+        if self.joystick is None or getattr(event, 'instance_id', None) != self.joystick.get_instance_id():
+            return
+
+        if event.type == pygame.JOYDEVICEREMOVED:
+            self.joystick = None
+            self.last_hat_state = (0, 0)
+            self._last_axis = [0.0] * 8
+            self.disconnected.emit()
+            # Another pad may still be attached; its JOYDEVICEADDED was ignored
+            if pygame.joystick.get_count() > 0:
+                self._adopt(0)
+
+        elif event.type == pygame.JOYBUTTONDOWN:
+            self.button_pressed.emit(event.button)
+
+        elif event.type == pygame.JOYBUTTONUP:
+            self.button_released.emit(event.button)
+
+        elif event.type == pygame.JOYAXISMOTION:
+            # Snap to centre inside the deadzone, then quantize to 1/127 steps
+            # so jitter on a held stick doesn't produce new values
+            value = event.value if abs(event.value) > self.deadzone else 0.0
+            value = round(value * 127) / 127.0
+            if value != self._last_axis[event.axis]:
+                self._last_axis[event.axis] = value
+                self.axis_moved.emit(event.axis, value)
+
+        elif event.type == pygame.JOYHATMOTION:
+            # D-Pad (hat) - convert to button events
+            # hat = (x, y) where x: -1=left, 1=right, y: -1=down, 1=up
+            hat = event.value
+
+            if hat != self.last_hat_state:
+                # Release old direction
+                if self.last_hat_state in _HAT_TO_BUTTON:
+                    self.button_released.emit(_HAT_TO_BUTTON[self.last_hat_state])
+
+                # Press new direction
+                if hat in _HAT_TO_BUTTON:
+                    self.button_pressed.emit(_HAT_TO_BUTTON[hat])
+
+                self.last_hat_state = hat
+
     def stop(self):
         """Stop the worker thread."""
         self.running = False
@@ -161,6 +182,13 @@ class GamepadManager(QObject):
 
         self.load_profile()
 
+    def _update_axis_scale(self):
+        """Precompute per-axis multipliers (sensitivity and Y inversion)."""
+        self._sensitivity = self.analog_settings.get('sensitivity', 1.0)
+        # Axes 1 and 3 are typically the Y axes
+        y_scale = -self._sensitivity if self.analog_settings.get('invert_y') else self._sensitivity
+        self._axis_scale = (self._sensitivity, y_scale, self._sensitivity, y_scale)
+
     def start(self):
         """Start listening for gamepad input."""
         if not PYGAME_AVAILABLE:
@@ -193,16 +221,10 @@ class GamepadManager(QObject):
 
     def _on_axis_moved(self, axis_index: int, value: float):
         """Handle axis movement."""
-        # Apply sensitivity
-        value *= self.analog_settings['sensitivity']
-
-        # Invert Y if configured (axes 1 and 3 are typically Y axes)
-        if self.analog_settings['invert_y'] and axis_index in (1, 3):
-            value = -value
-
-        axis_names = {0: 'left_x', 1: 'left_y', 2: 'right_x', 3: 'right_y'}
-        axis_name = axis_names.get(axis_index, f'axis_{axis_index}')
-        self.axis_moved.emit(axis_name, value)
+        if axis_index < 4:
+            self.axis_moved.emit(_AXIS_NAMES[axis_index], value * self._axis_scale[axis_index])
+        else:
+            self.axis_moved.emit(f'axis_{axis_index}', value * self._sensitivity)
 
     def _on_connected(self, name: str):
         """Handle gamepad connection."""
@@ -233,10 +255,12 @@ class GamepadManager(QObject):
     def set_sensitivity(self, value: float):
         """Set analog sensitivity."""
         self.analog_settings['sensitivity'] = max(0.5, min(2.0, value))
+        self._update_axis_scale()
 
     def set_invert_y(self, invert: bool):
         """Set Y axis inversion."""
         self.analog_settings['invert_y'] = invert
+        self._update_axis_scale()
 
     def reset_to_defaults(self):
         """Reset mappings to defaults."""
@@ -246,6 +270,7 @@ class GamepadManager(QObject):
             'sensitivity': 1.0,
             'invert_y': False,
         }
+        self._update_axis_scale()
 
     def load_profile(self, name: str = None):
         """Load a gamepad profile."""
@@ -254,6 +279,7 @@ class GamepadManager(QObject):
             if profile:
                 self.mappings = profile.get('buttons', dict(self.DEFAULT_MAPPINGS))
                 self.analog_settings = profile.get('analog', self.analog_settings)
+        self._update_axis_scale()
 
     def save_profile(self, name: str):
         """Save current settings as a profile."""
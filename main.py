@@ -5,13 +5,14 @@ DMX Visualizer Control - Steam Deck Remote Control App
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add app directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QFontDatabase
+from PyQt5.QtCore import Qt, QByteArray
+from PyQt5.QtGui import QFontDatabase, QPixmapCache
 
 from ui.main_window import MainWindow
 
@@ -20,9 +21,21 @@ def load_fonts():
     """Load custom fonts for the Retro theme."""
     fonts_dir = os.path.join(os.path.dirname(__file__), 'resources', 'fonts')
     if os.path.exists(fonts_dir):
-        for font_file in os.listdir(fonts_dir):
-            if font_file.endswith(('.ttf', '.otf')):
-                QFontDatabase.addApplicationFont(os.path.join(fonts_dir, font_file))
+        paths = [
+            os.path.join(fonts_dir, font_file)
+            for font_file in os.listdir(fonts_dir)
+            if font_file.endswith(('.ttf', '.otf'))
+        ]
+        # Read the files concurrently; registration itself must stay on the GUI thread
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for data in pool.map(_read_file, paths):
+                QFontDatabase.addApplicationFontFromData(QByteArray(data))
+
+
+def _read_file(path):
+    """Read a file's raw bytes."""
+    with open(path, 'rb') as f:
+        return f.read()
 
 
 def main():
@@ -34,6 +47,9 @@ def main():
     app.setApplicationName("DMX Visualizer Control")
     app.setOrganizationName("GeoDraw")
 
+    # Room for every gobo thumbnail (limit in KB)
+    QPixmapCache.setCacheLimit(20480)
+
     # Load custom fonts
     load_fonts()
 
@@ -3,12 +3,12 @@ Main Window - DMX Visualizer Control
 """
 
 import os
+from bisect import bisect_left, bisect_right
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLabel, QPushButton, QFrame
+    QTabWidget, QLabel, QFrame, QApplication, QScrollArea
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QTimer, QEvent
 
 from ui.views.status_view import StatusView
 from ui.views.outputs_view import OutputsView
@@ -18,16 +18,59 @@ from ui.views.ndi_view import NDIView
 from ui.views.gamepad_view import GamepadView
 from ui.views.settings_view import SettingsView
 from core.api_client import APIClient
+from core.api_client_qt import QtAPIClient
 from core.gamepad_manager import GamepadManager
 from core.config_manager import ConfigManager
 
 
+# Events on a page or scroll viewport after which cached focus positions
+# (see _focus_index) no longer hold
+_FOCUS_STALE_EVENTS = frozenset((
+    QEvent.LayoutRequest, QEvent.Resize, QEvent.ChildAdded, QEvent.ChildRemoved,
+))
+
+_TABS_QSS = """
+QTabWidget::pane {
+    border: none;
+    background: transparent;
+}
+QTabBar::tab {
+    background: rgba(20, 30, 50, 0.8);
+    color: #8099b3;
+    padding: 12px 24px;
+    margin-right: 2px;
+    border: none;
+    font-size: 14px;
+    font-weight: bold;
+}
+QTabBar::tab:selected {
+    background: rgba(0, 255, 255, 0.15);
+    color: #00ffff;
+    border-bottom: 2px solid #00ffff;
+}
+QTabBar::tab:hover:!selected {
+    background: rgba(0, 255, 255, 0.08);
+}
+"""
+
+
 class MainWindow(QMainWindow):
+    # Theme stylesheet text by path, shared across windows
+    _QSS_CACHE = {}
+
+    # Connection check interval, doubled per consecutive failure up to the max
+    POLL_INTERVAL_MS = 5000
+    MAX_POLL_INTERVAL_MS = 60000
+
     def __init__(self):
         super().__init__()
 
         self.config = ConfigManager()
-        self.api = APIClient(self.config.get('server_url', 'http://localhost:8082'))
+        self.api = APIClient(
+            self.config.get('server_url', 'http://localhost:8082'),
+            http2=self.config.get('http2', False),
+        )
+        self.qt_api = QtAPIClient(self.api, self)
         self.gamepad = GamepadManager()
 
         self.init_ui()
@@ -57,48 +100,30 @@ class MainWindow(QMainWindow):
         # Tab widget - takes all remaining space
         self.tabs = QTabWidget()
         self.tabs.setDocumentMode(True)
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background: transparent;
-            }
-            QTabBar::tab {
-                background: rgba(20, 30, 50, 0.8);
-                color: #8099b3;
-                padding: 12px 24px;
-                margin-right: 2px;
-                border: none;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background: rgba(0, 255, 255, 0.15);
-                color: #00ffff;
-                border-bottom: 2px solid #00ffff;
-            }
-            QTabBar::tab:hover:!selected {
-                background: rgba(0, 255, 255, 0.08);
-            }
-        """)
+        self.tabs.setStyleSheet(_TABS_QSS)
         layout.addWidget(self.tabs)
 
-        # Create views
-        self.status_view = StatusView(self.api)
-        self.outputs_view = OutputsView(self.api)
-        self.gobos_view = GobosView(self.api)
-        self.media_view = MediaView(self.api)
-        self.ndi_view = NDIView(self.api)
-        self.gamepad_view = GamepadView(self.gamepad, self.config)
-        self.settings_view = SettingsView(self.api, self.config, self)
-
-        # Add tabs
-        self.tabs.addTab(self.status_view, "STATUS")
-        self.tabs.addTab(self.outputs_view, "OUTPUTS")
-        self.tabs.addTab(self.gobos_view, "GOBOS")
-        self.tabs.addTab(self.media_view, "MEDIA")
-        self.tabs.addTab(self.ndi_view, "NDI")
-        self.tabs.addTab(self.gamepad_view, "GAMEPAD")
-        self.tabs.addTab(self.settings_view, "SETTINGS")
+        # Views are built on first activation; each tab starts as a placeholder
+        self._tab_views = (
+            ('status_view', "STATUS", lambda: StatusView(self.api, self.qt_api)),
+            ('outputs_view', "OUTPUTS", lambda: OutputsView(self.api, self.qt_api)),
+            ('gobos_view', "GOBOS", lambda: GobosView(self.api, self.qt_api)),
+            ('media_view', "MEDIA", lambda: MediaView(self.api)),
+            ('ndi_view', "NDI", lambda: NDIView(self.api)),
+            ('gamepad_view', "GAMEPAD", lambda: GamepadView(self.gamepad, self.config)),
+            ('settings_view', "SETTINGS", lambda: SettingsView(self.api, self.config, self)),
+        )
+        self._built = set()
+        for attr, title, _ in self._tab_views:
+            setattr(self, attr, None)
+            self.tabs.addTab(QWidget(), title)
+        self._tab_count = self.tabs.count()
+        # Even the first tab is built after the window is shown
+        QTimer.singleShot(0, lambda: self._ensure_tab_built(self.tabs.currentIndex()))
+
+        # Focus navigation index per tab (see _focus_index)
+        self._focus_cache = {}
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
     def create_header(self):
         """Create compact header."""
@@ -124,12 +149,15 @@ class MainWindow(QMainWindow):
         layout.addStretch()
 
         # Connection status - compact
+        # Colours come from the theme's [state=...] rules
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("font-size: 16px; color: #ff1a4d;")
+        self.status_indicator.setObjectName("statusIndicator")
+        self.status_indicator.setProperty("state", "disconnected")
         layout.addWidget(self.status_indicator)
 
         self.status_label = QLabel("Disconnected")
-        self.status_label.setStyleSheet("color: #808080; font-size: 12px;")
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "disconnected")
         layout.addWidget(self.status_label)
 
         return header
@@ -140,44 +168,63 @@ class MainWindow(QMainWindow):
             os.path.dirname(__file__),
             'styles', 'retro_theme.qss'
         )
-        if os.path.exists(style_path):
+        qss = self._QSS_CACHE.get(style_path)
+        if qss is None:
+            if not os.path.exists(style_path):
+                return
             with open(style_path, 'r') as f:
-                self.setStyleSheet(f.read())
+                qss = self._QSS_CACHE[style_path] = f.read()
+
+        # Apply once application-wide so every window and dialog inherits it
+        app = QApplication.instance()
+        if app.styleSheet() != qss:
+            app.setStyleSheet(qss)
 
     def setup_gamepad(self):
         """Set up gamepad input handling."""
-        self.gamepad.button_pressed.connect(self.on_gamepad_button)
+        self._gamepad_actions = {
+            'prev_tab': self.prev_tab,
+            'next_tab': self.next_tab,
+            'select': self.activate_focused,
+            'back': self.go_back,
+            'nav_down': self.focus_next,
+            'nav_up': self.focus_prev,
+            'nav_left': self.focus_left,
+            'nav_right': self.focus_right,
+        }
+        # Keyboard equivalents for testing without a gamepad
+        self._key_actions = {
+            (Qt.Key_Left, int(Qt.ControlModifier)): self.prev_tab,
+            (Qt.Key_Right, int(Qt.ControlModifier)): self.next_tab,
+            Qt.Key_Down: self.focus_next,
+            Qt.Key_Up: self.focus_prev,
+            Qt.Key_Left: self.focus_left,
+            Qt.Key_Right: self.focus_right,
+            Qt.Key_Return: self.activate_focused,
+            Qt.Key_Space: self.activate_focused,
+        }
+        try:
+            self.gamepad.button_pressed.connect(self.on_gamepad_button, Qt.UniqueConnection)
+        except TypeError:
+            pass  # Already connected
         self.gamepad.start()
 
     def on_gamepad_button(self, button, action):
         """Handle gamepad button presses."""
-        if action == 'prev_tab':
-            self.prev_tab()
-        elif action == 'next_tab':
-            self.next_tab()
-        elif action == 'select':
-            self.activate_focused()
-        elif action == 'back':
-            self.go_back()
-        elif action == 'nav_down':
-            self.focus_next()
-        elif action == 'nav_up':
-            self.focus_prev()
-        elif action == 'nav_left':
-            self.focus_left()
-        elif action == 'nav_right':
-            self.focus_right()
+        handler = self._gamepad_actions.get(action)
+        if handler:
+            handler()
 
     def prev_tab(self):
         """Switch to previous tab."""
         current = self.tabs.currentIndex()
-        new_index = (current - 1) % self.tabs.count()
+        new_index = (current - 1) % self._tab_count
         self.tabs.setCurrentIndex(new_index)
 
     def next_tab(self):
         """Switch to next tab."""
         current = self.tabs.currentIndex()
-        new_index = (current + 1) % self.tabs.count()
+        new_index = (current + 1) % self._tab_count
         self.tabs.setCurrentIndex(new_index)
 
     def activate_focused(self):
@@ -206,6 +253,75 @@ class MainWindow(QMainWindow):
         """Move focus right."""
         self._navigate_focus('right')
 
+    def _on_tab_changed(self, index):
+        """Build the tab's view if needed and refresh its focus candidates."""
+        self._ensure_tab_built(index)
+        self._focus_cache.pop(index, None)
+
+    def _ensure_tab_built(self, index):
+        """Replace a tab's placeholder with its real view."""
+        if index in self._built or not 0 <= index < len(self._tab_views):
+            return
+        self._built.add(index)
+
+        attr, title, factory = self._tab_views[index]
+        view = factory()
+        setattr(self, attr, view)
+
+        # Swapping pages moves the current index; keep that internal
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, view, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _focus_index(self, page):
+        """Get the focusable widgets of the current tab sorted by x and by y.
+
+        Positions are relative to page. Returns (by_x, xs, by_y, ys): by_x
+        holds (x, y, widget) sorted on x with xs the matching keys for bisect,
+        by_y likewise with (y, x, widget). Hidden and disabled widgets are
+        included; _navigate_focus skips them, so toggling them needs no rescan.
+        """
+        index = self.tabs.currentIndex()
+        focus_index = self._focus_cache.get(index)
+        if focus_index is None:
+            points = []
+            if page is not None:
+                self._watch_focus_page(page)
+                for widget in page.findChildren(QWidget):
+                    if widget.focusPolicy() != Qt.NoFocus:
+                        center = widget.mapTo(page, widget.rect().center())
+                        points.append((center.x(), center.y(), widget))
+
+            by_x = sorted(points, key=lambda p: p[0])
+            by_y = sorted(((y, x, w) for x, y, w in points), key=lambda p: p[0])
+            focus_index = (by_x, [p[0] for p in by_x], by_y, [p[0] for p in by_y])
+            self._focus_cache[index] = focus_index
+        return focus_index
+
+    def _watch_focus_page(self, page):
+        """Drop cached focus positions when the page relayouts or scrolls."""
+        if page.property('focusWatched'):
+            return
+        page.setProperty('focusWatched', True)
+        page.installEventFilter(self)
+        for area in page.findChildren(QScrollArea):
+            area.viewport().installEventFilter(self)
+            area.verticalScrollBar().valueChanged.connect(self._clear_focus_cache)
+            area.horizontalScrollBar().valueChanged.connect(self._clear_focus_cache)
+
+    def _clear_focus_cache(self, *_):
+        self._focus_cache.clear()
+
+    def eventFilter(self, obj, event):
+        """Drop cached focus positions when a watched page or viewport changes."""
+        if event.type() in _FOCUS_STALE_EVENTS:
+            self._focus_cache.clear()
+        return super().eventFilter(obj, event)
+
     def _navigate_focus(self, direction):
         """Navigate focus in a spatial direction."""
         current = self.focusWidget()
@@ -214,50 +330,42 @@ class MainWindow(QMainWindow):
             self.focusNextChild()
             return
 
-        # Get current widget's screen position
-        current_rect = current.rect()
-        current_pos = current.mapToGlobal(current_rect.center())
-
-        # Find all focusable widgets
-        focusable = []
-        for widget in self.findChildren(QWidget):
-            if (widget.isVisible() and
-                widget.isEnabled() and
-                widget.focusPolicy() != Qt.NoFocus and
-                widget != current):
-                focusable.append(widget)
+        # Get current widget's position in the same coordinates as the index
+        page = self.tabs.currentWidget()
+        current_pos = current.mapToGlobal(current.rect().center())
+        if page is not None:
+            current_pos = page.mapFromGlobal(current_pos)
+        by_x, xs, by_y, ys = self._focus_index(page)
+
+        # Search along one axis; the other axis only adds a penalty
+        if direction in ('down', 'up'):
+            entries, keys = by_y, ys
+            main, cross = current_pos.y(), current_pos.x()
+        else:
+            entries, keys = by_x, xs
+            main, cross = current_pos.x(), current_pos.y()
 
-        if not focusable:
-            return
+        # Only widgets more than 20px away in the direction qualify
+        if direction in ('down', 'right'):
+            order = range(bisect_right(keys, main + 20), len(entries))
+        else:
+            order = range(bisect_left(keys, main - 20) - 1, -1, -1)
 
-        # Find best candidate in the direction
+        # Find best candidate in the direction, nearest first
         best = None
         best_score = float('inf')
 
-        for widget in focusable:
-            widget_rect = widget.rect()
-            widget_pos = widget.mapToGlobal(widget_rect.center())
-
-            dx = widget_pos.x() - current_pos.x()
-            dy = widget_pos.y() - current_pos.y()
-
-            # Check if widget is in the right direction
-            in_direction = False
-            if direction == 'down' and dy > 20:
-                in_direction = True
-                # Prefer widgets directly below (small dx)
-                score = dy + abs(dx) * 2
-            elif direction == 'up' and dy < -20:
-                in_direction = True
-                score = -dy + abs(dx) * 2
-            elif direction == 'right' and dx > 20:
-                in_direction = True
-                score = dx + abs(dy) * 2
-            elif direction == 'left' and dx < -20:
-                in_direction = True
-                score = -dx + abs(dy) * 2
-
-            if in_direction and score < best_score:
+        for i in order:
+            key, other, widget = entries[i]
+            distance = abs(key - main)
+            if distance >= best_score:
+                break  # Score is never less than the distance, nothing closer remains
+            if widget is current or not (widget.isVisible() and widget.isEnabled()):
+                continue
+
+            # Prefer widgets in line with the current one (small cross offset)
+            score = distance + abs(other - cross) * 2
+            if score < best_score:
                 best_score = score
                 best = widget
 
@@ -266,51 +374,74 @@ class MainWindow(QMainWindow):
 
     def start_connection_check(self):
         """Start periodic connection checking."""
+        self._poll_interval_ms = self.POLL_INTERVAL_MS
+        self._consecutive_fail = 0
+        self._status_reply = None
+
+        # Single-shot: the next check is scheduled once the current one finishes
         self.connection_timer = QTimer()
+        self.connection_timer.setSingleShot(True)
         self.connection_timer.timeout.connect(self.check_connection)
-        self.connection_timer.start(5000)
         self.check_connection()
 
     def check_connection(self):
         """Check connection to DMX Visualizer."""
-        try:
-            status = self.api.get_status()
-            self.set_connected(True)
-        except Exception:
-            self.set_connected(False)
+        if self._status_reply is not None:
+            return
+        self._status_reply = self.qt_api.ping(self._on_connection_checked)
 
-    def set_connected(self, connected):
-        """Update connection status display."""
+    def _on_connection_checked(self, connected):
+        """Schedule the next check, backing off exponentially while unreachable."""
+        self._status_reply = None
         if connected:
-            self.status_indicator.setStyleSheet("font-size: 16px; color: #33ff66;")
-            self.status_label.setText("Connected")
-            self.status_label.setStyleSheet("color: #33ff66; font-size: 12px;")
+            self._consecutive_fail = 0
+            self._poll_interval_ms = self.POLL_INTERVAL_MS
         else:
-            self.status_indicator.setStyleSheet("font-size: 16px; color: #ff1a4d;")
-            self.status_label.setText("Disconnected")
-            self.status_label.setStyleSheet("color: #808080; font-size: 12px;")
+            self._consecutive_fail += 1
+            self._poll_interval_ms = min(
+                self.MAX_POLL_INTERVAL_MS,
+                self.POLL_INTERVAL_MS * 2 ** self._consecutive_fail)
+        self.set_connected(connected)
+        self.connection_timer.start(self._poll_interval_ms)
+
+    def set_connected(self, connected):
+        """Update connection status display."""
+        state = "connected" if connected else "disconnected"
+        if self.status_label.property("state") == state:
+            return
+
+        self.status_label.setText("Connected" if connected else "Disconnected")
+        for widget in (self.status_indicator, self.status_label):
+            widget.setProperty("state", state)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def resizeEvent(self, event):
+        """Drop cached focus positions when the layout changes."""
+        self._focus_cache.clear()
+        super().resizeEvent(event)
 
     def keyPressEvent(self, event):
         """Handle keyboard input for testing."""
-        if event.key() == Qt.Key_Left and event.modifiers() == Qt.ControlModifier:
-            self.prev_tab()
-        elif event.key() == Qt.Key_Right and event.modifiers() == Qt.ControlModifier:
-            self.next_tab()
-        elif event.key() == Qt.Key_Down:
-            self.focus_next()
-        elif event.key() == Qt.Key_Up:
-            self.focus_prev()
-        elif event.key() == Qt.Key_Left:
-            self.focus_left()
-        elif event.key() == Qt.Key_Right:
-            self.focus_right()
-        elif event.key() == Qt.Key_Return or event.key() == Qt.Key_Space:
-            self.activate_focused()
+        key = event.key()
+        # Exact (key, modifiers) bindings win over bare-key ones
+        handler = (self._key_actions.get((key, int(event.modifiers()))) or
+                   self._key_actions.get(key))
+        if handler:
+            handler()
         else:
             super().keyPressEvent(event)
 
     def closeEvent(self, event):
         """Clean up on close."""
+        try:
+            self.gamepad.button_pressed.disconnect(self.on_gamepad_button)
+        except TypeError:
+            pass
         self.gamepad.stop()
+        if self._status_reply is not None:
+            self._status_reply.abort()
         self.connection_timer.stop()
+        self.api.close()
+        self.config.flush()
         event.accept()
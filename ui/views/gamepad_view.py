@@ -4,11 +4,11 @@ Gamepad View - Simplified layout
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QListWidget, QListWidgetItem, QPushButton,
-    QComboBox, QSlider, QCheckBox, QScrollArea,
-    QInputDialog, QFileDialog
+    QListWidget, QListWidgetItem, QPushButton,
+    QComboBox, QScrollArea, QInputDialog
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
 
 from core.gamepad_manager import AVAILABLE_ACTIONS, BUTTON_NAMES
 
@@ -19,6 +19,8 @@ class GamepadView(QWidget):
         self.gamepad = gamepad_manager
         self.config = config_manager
         self.button_combos = {}
+        # Combo index of each action; every combo lists AVAILABLE_ACTIONS in order
+        self._action_index = {action_id: i for i, action_id in enumerate(AVAILABLE_ACTIONS)}
         self.init_ui()
         self.setup_signals()
 
@@ -34,7 +36,8 @@ class GamepadView(QWidget):
         # Status
         status_row = QHBoxLayout()
         self.status_dot = QLabel("●")
-        self.status_dot.setStyleSheet("color: #ff1a4d; font-size: 24px;")
+        self.status_dot.setObjectName("gamepadStatusDot")
+        self.status_dot.setProperty("state", "disconnected")
         status_row.addWidget(self.status_dot)
         self.status_text = QLabel("No gamepad")
         status_row.addWidget(self.status_text)
@@ -78,6 +81,13 @@ class GamepadView(QWidget):
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setSpacing(8)
 
+        # One action list backs every mapping combo
+        actions_model = QStandardItemModel(self)
+        for action_id, action_name in AVAILABLE_ACTIONS.items():
+            item = QStandardItem(action_name)
+            item.setData(action_id, Qt.UserRole)
+            actions_model.appendRow(item)
+
         for btn_id, btn_name in BUTTON_NAMES.items():
             row = QHBoxLayout()
 
@@ -86,17 +96,14 @@ class GamepadView(QWidget):
             row.addWidget(label)
 
             combo = QComboBox()
-            for action_id, action_name in AVAILABLE_ACTIONS.items():
-                combo.addItem(action_name, action_id)
+            combo.setModel(actions_model)
 
-            current = self.gamepad.get_mapping(btn_id)
-            idx = combo.findData(current)
-            if idx >= 0:
+            idx = self._action_index.get(self.gamepad.get_mapping(btn_id))
+            if idx is not None:
                 combo.setCurrentIndex(idx)
 
-            combo.currentIndexChanged.connect(
-                lambda i, b=btn_id, c=combo: self.on_mapping_changed(b, c)
-            )
+            combo.setProperty('btn_id', btn_id)
+            combo.currentIndexChanged.connect(self._on_mapping_changed)
             row.addWidget(combo, 1)
 
             self.button_combos[btn_id] = combo
@@ -112,8 +119,13 @@ class GamepadView(QWidget):
         self.refresh_status()
 
     def setup_signals(self):
-        self.gamepad.gamepad_connected.connect(self.on_connected)
-        self.gamepad.gamepad_disconnected.connect(self.on_disconnected)
+        # The gamepad manager outlives this view; never stack duplicate handlers
+        for signal, slot in ((self.gamepad.gamepad_connected, self.on_connected),
+                             (self.gamepad.gamepad_disconnected, self.on_disconnected)):
+            try:
+                signal.connect(slot, Qt.UniqueConnection)
+            except TypeError:
+                pass  # Already connected
 
     def refresh_profiles(self):
         self.profiles_list.clear()
@@ -131,26 +143,38 @@ class GamepadView(QWidget):
             self.on_disconnected()
 
     def on_connected(self, name):
-        self.status_dot.setStyleSheet("color: #33ff66; font-size: 24px;")
+        self._set_status_state("connected")
         self.status_text.setText(name)
 
     def on_disconnected(self):
-        self.status_dot.setStyleSheet("color: #ff1a4d; font-size: 24px;")
+        self._set_status_state("disconnected")
         self.status_text.setText("No gamepad")
 
+    def _set_status_state(self, state):
+        # Repolish so the theme's [state=...] rule takes effect
+        if self.status_dot.property("state") != state:
+            self.status_dot.setProperty("state", state)
+            self.status_dot.style().unpolish(self.status_dot)
+            self.status_dot.style().polish(self.status_dot)
+
     def on_profile_selected(self, item):
         if item:
             profile = self.config.get_gamepad_profile(item.data(Qt.UserRole))
             if profile:
                 buttons = profile.get('buttons', {})
                 for btn_id, combo in self.button_combos.items():
-                    action = buttons.get(str(btn_id), 'none')
-                    idx = combo.findData(action)
-                    if idx >= 0:
-                        combo.setCurrentIndex(idx)
-
-    def on_mapping_changed(self, btn_id, combo):
-        self.gamepad.set_mapping(btn_id, combo.currentData())
+                    idx = self._action_index.get(buttons.get(str(btn_id), 'none'))
+                    if idx is None or idx == combo.currentIndex():
+                        continue
+                    # Apply the mapping directly rather than via currentIndexChanged
+                    combo.blockSignals(True)
+                    combo.setCurrentIndex(idx)
+                    combo.blockSignals(False)
+                    self.gamepad.set_mapping(btn_id, combo.currentData())
+
+    def _on_mapping_changed(self, index):
+        combo = self.sender()
+        self.gamepad.set_mapping(combo.property('btn_id'), combo.currentData())
 
     def new_profile(self):
         name, ok = QInputDialog.getText(self, "New Profile", "Name:")
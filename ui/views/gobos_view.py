@@ -2,26 +2,44 @@
 Gobos View - Gobo grid management
 """
 
+from collections import deque
+from functools import partial
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFrame, QGridLayout, QPushButton, QSpinBox,
     QFileDialog, QScrollArea
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import Qt, QTimer, QBuffer, QByteArray, QSize, QEvent, QUrl
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImageReader
+from PyQt5.QtNetwork import QNetworkRequest
+
+from core.api_worker import ApiWorker
 
 
 class GobosView(QWidget):
-    def __init__(self, api):
+    # Maximum thumbnail downloads in flight at once
+    MAX_INFLIGHT = 6
+    # Quiet period before a requested refresh runs
+    REFRESH_DELAY_MS = 300
+
+    def __init__(self, api, qt_api):
         super().__init__()
         self.api = api
+        self.qt_api = qt_api
         self.selected_slot = 21
+        self._prev_selected_slot = None  # Slot whose card currently shows as selected
         self.gobo_widgets = {}
-        self.network_manager = QNetworkAccessManager()
-        self.network_manager.finished.connect(self.on_image_loaded)
-        self.pending_loads = {}
+        # Shared with the other views so they all reuse the same connections
+        self.network_manager = qt_api.nam
+        self.pending_loads = {}  # In-flight reply -> (slot, pixmap key)
+        self._pending_queue = deque()  # (slot, gobo_id, pixmap key) waiting to be requested
+
+        # Coalesces bursts of refresh() calls (e.g. consecutive uploads)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self.init_ui()
 
     def init_ui(self):
@@ -78,27 +96,31 @@ class GobosView(QWidget):
         scroll.setStyleSheet("QScrollArea { border: none; }")
 
         grid_widget = QWidget()
+        self._grid_widget = grid_widget
         self.grid_layout = QGridLayout(grid_widget)
         self.grid_layout.setSpacing(8)
 
-        # Create grid items (21-200 = 180 slots)
+        # Create grid items (21-200 = 180 slots), laid out and painted once at the end
+        grid_widget.setUpdatesEnabled(False)
         for i, slot in enumerate(range(21, 201)):
             row = i // 10
             col = i % 10
             item = self.create_gobo_item(slot)
             self.grid_layout.addWidget(item, row, col)
             self.gobo_widgets[slot] = item
+        grid_widget.setUpdatesEnabled(True)
 
         scroll.setWidget(grid_widget)
         layout.addWidget(scroll)
 
-        self.refresh()
+        self._do_refresh()
 
     def create_gobo_item(self, slot):
         item = QFrame()
         item.setFixedSize(100, 100)
         item.setObjectName("card")
-        item.slot = slot
+        item.setProperty('slot', slot)
+        item.installEventFilter(self)
 
         item_layout = QVBoxLayout(item)
         item_layout.setContentsMargins(4, 4, 4, 4)
@@ -107,31 +129,42 @@ class GobosView(QWidget):
         image_label = QLabel()
         image_label.setFixedSize(80, 70)
         image_label.setAlignment(Qt.AlignCenter)
-        image_label.setStyleSheet("background: black; border-radius: 4px;")
+        image_label.setObjectName("card_image")
         image_label.setText("Empty")
-        image_label.setStyleSheet("background: black; color: #808080; font-size: 10px;")
         item_layout.addWidget(image_label, alignment=Qt.AlignCenter)
 
         slot_label = QLabel(f"#{slot}")
-        slot_label.setStyleSheet("color: #9900ff; font-size: 10px;")
+        slot_label.setObjectName("card_slot")
         slot_label.setAlignment(Qt.AlignCenter)
         item_layout.addWidget(slot_label)
 
         item.image_label = image_label
-        item.mousePressEvent = lambda e, s=slot: self.on_item_clicked(s)
 
         return item
 
+    def eventFilter(self, obj, event):
+        """Select a grid item when it is clicked."""
+        if event.type() == QEvent.MouseButtonPress:
+            slot = obj.property('slot')
+            if slot is not None:
+                self.on_item_clicked(slot)
+                return True
+        return super().eventFilter(obj, event)
+
     def on_item_clicked(self, slot):
         self.selected_slot = slot
         self.slot_spin.setValue(slot)
 
-        # Update selection styling
-        for s, widget in self.gobo_widgets.items():
-            if s == slot:
-                widget.setStyleSheet("QFrame { border: 2px solid #00ffff; }")
-            else:
-                widget.setStyleSheet("")
+        # Update selection styling; only the old and new cards need a repolish
+        if slot == self._prev_selected_slot:
+            return
+        for s, selected in ((self._prev_selected_slot, False), (slot, True)):
+            widget = self.gobo_widgets.get(s)
+            if widget is not None:
+                widget.setProperty('selected', selected)
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+        self._prev_selected_slot = slot
 
     def on_slot_changed(self, value):
         self.on_item_clicked(value)
@@ -145,56 +178,111 @@ class GobosView(QWidget):
             self.upload_gobo(file_path)
 
     def upload_gobo(self, file_path):
-        try:
-            self.api.upload_gobo(self.selected_slot, file_path)
-            # Move to next slot
-            if self.selected_slot < 200:
-                self.selected_slot += 1
-                self.slot_spin.setValue(self.selected_slot)
-            self.refresh()
-        except Exception as e:
-            print(f"Error uploading gobo: {e}")
+        slot = self.selected_slot
+        ApiWorker.start(partial(self.api.upload_gobo, slot, file_path),
+                        partial(self._on_gobo_uploaded, slot),
+                        self._on_upload_failed)
+
+    def _on_gobo_uploaded(self, slot, _):
+        # The slot's old thumbnail may be cached under an unchanged key
+        key = getattr(self.gobo_widgets.get(slot), 'pixmap_key', None)
+        if key:
+            QPixmapCache.remove(key)
+        # Move to next slot
+        if slot == self.selected_slot and self.selected_slot < 200:
+            self.selected_slot += 1
+            self.slot_spin.setValue(self.selected_slot)
+        self.refresh()
+
+    def _on_upload_failed(self, e):
+        print(f"Error uploading gobo: {e}")
 
     def refresh(self):
+        """Schedule a refresh; calls within the quiet period are merged."""
+        self._refresh_timer.start(self.REFRESH_DELAY_MS)
+
+    def _do_refresh(self):
         try:
             gobos = self.api.get_gobos()
 
-            # Reset all items
-            for slot, widget in self.gobo_widgets.items():
-                widget.image_label.setPixmap(QPixmap())
-                widget.image_label.setText("Empty")
-                widget.image_label.setStyleSheet("background: black; color: #808080; font-size: 10px;")
-                widget.has_gobo = False
-
-            # Load gobo images
-            for gobo in gobos:
-                slot = gobo.get('slot')
-                if slot and slot in self.gobo_widgets:
-                    widget = self.gobo_widgets[slot]
-                    widget.has_gobo = True
-                    widget.gobo_id = gobo.get('id')
-                    widget.image_label.setText("Loading...")
-
-                    # Load image
-                    url = QUrl(self.api.get_gobo_image_url(gobo['id']))
-                    request = QNetworkRequest(url)
-                    reply = self.network_manager.get(request)
-                    self.pending_loads[reply] = slot
+            # Repaint the grid once after all labels are updated
+            self._grid_widget.setUpdatesEnabled(False)
+            try:
+                # Reset all items
+                for slot, widget in self.gobo_widgets.items():
+                    widget.image_label.setPixmap(QPixmap())
+                    widget.image_label.setText("Empty")
+                    widget.has_gobo = False
+                    widget.pixmap_key = None
+
+                # Queue gobo images not already cached; downloads from a previous
+                # refresh are superseded
+                self._pending_queue.clear()
+                for gobo in gobos:
+                    slot = gobo.get('slot')
+                    if slot and slot in self.gobo_widgets:
+                        widget = self.gobo_widgets[slot]
+                        widget.has_gobo = True
+                        widget.gobo_id = gobo.get('id')
+                        widget.pixmap_key = f"gobo:{gobo['id']}:{gobo.get('etag', '')}"
+                        pixmap = QPixmapCache.find(widget.pixmap_key)
+                        if pixmap is not None:
+                            self._show_pixmap(widget, pixmap)
+                        else:
+                            widget.image_label.setText("Loading...")
+                            self._pending_queue.append((slot, gobo['id'], widget.pixmap_key))
+            finally:
+                self._grid_widget.setUpdatesEnabled(True)
+
+            self._pump_queue()
 
         except Exception as e:
             print(f"Error refreshing gobos: {e}")
 
+    def _pump_queue(self):
+        """Start queued image downloads up to MAX_INFLIGHT."""
+        while self._pending_queue and len(self.pending_loads) < self.MAX_INFLIGHT:
+            slot, gobo_id, key = self._pending_queue.popleft()
+            request = QNetworkRequest(QUrl(self.api.get_gobo_thumbnail_url(gobo_id, size=80)))
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+            # Over HTTP/1.1, keep the connection open and pipeline the queued downloads
+            request.setAttribute(QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+            request.setRawHeader(b'Connection', b'keep-alive')
+            request.setTransferTimeout(5000)
+            reply = self.network_manager.get(request)
+            reply.finished.connect(partial(self.on_image_loaded, reply))
+            self.pending_loads[reply] = (slot, key)
+
     def on_image_loaded(self, reply):
-        slot = self.pending_loads.pop(reply, None)
-        if slot is None or reply.error():
+        pending = self.pending_loads.pop(reply, None)
+        reply.deleteLater()
+        self._pump_queue()
+        if pending is None or reply.error():
             return
 
-        if slot in self.gobo_widgets:
-            widget = self.gobo_widgets[slot]
-            data = reply.readAll()
-            pixmap = QPixmap()
-            if pixmap.loadFromData(data):
-                scaled = pixmap.scaled(70, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                widget.image_label.setPixmap(scaled)
-                widget.image_label.setText("")
-                widget.image_label.setStyleSheet("background: black;")
+        slot, key = pending
+        scaled = self._decode_thumbnail(reply.readAll())
+        if scaled.isNull():
+            return
+        # The key names this exact image, so it is worth caching either way
+        QPixmapCache.insert(key, scaled)
+        # A refresh since the request may have emptied or reassigned the slot
+        widget = self.gobo_widgets.get(slot)
+        if widget is not None and widget.pixmap_key == key:
+            self._show_pixmap(widget, scaled)
+
+    def _decode_thumbnail(self, data):
+        """Decode image data and scale it to thumbnail size."""
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        reader = QImageReader(buffer)
+        size = reader.size()
+        if size.isValid():
+            # Servers without thumbnail support send the full image. Only JPEG
+            # is scaled while decoding; PNG is decoded in full, then scaled.
+            reader.setScaledSize(size.scaled(QSize(70, 60), Qt.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
+
+    def _show_pixmap(self, widget, pixmap):
+        """Show a scaled thumbnail on a grid item."""
+        widget.image_label.setPixmap(pixmap)
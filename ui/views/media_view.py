@@ -4,15 +4,18 @@ Media View - Simplified layout
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFileDialog, QListWidget, QListWidgetItem
+    QPushButton, QFileDialog, QListWidget
 )
-from PyQt5.QtCore import Qt
+
+from core.api_worker import ApiWorker
 
 
 class MediaView(QWidget):
     def __init__(self, api):
         super().__init__()
         self.api = api
+        self._loading = False  # A media fetch is running on the thread pool
+        self._refresh_pending = False  # refresh() was called during that fetch
         self.init_ui()
 
     def init_ui(self):
@@ -25,9 +28,9 @@ class MediaView(QWidget):
         header.addWidget(QLabel("MEDIA (Slots 201-255)"))
         header.addStretch()
 
-        refresh_btn = QPushButton("REFRESH")
-        refresh_btn.clicked.connect(self.refresh)
-        header.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("REFRESH")
+        self.refresh_btn.clicked.connect(self.refresh)
+        header.addWidget(self.refresh_btn)
 
         layout.addLayout(header)
 
@@ -52,35 +55,69 @@ class MediaView(QWidget):
         self.refresh()
 
     def refresh(self):
-        self.media_list.clear()
+        if self._loading:
+            # Run again once the current load lands, so it sees newer changes
+            self._refresh_pending = True
+            return
+        self._loading = True
+        self.refresh_btn.setEnabled(False)
+        ApiWorker.start(self._fetch_media, self._on_media_loaded, self._on_media_failed)
+
+    def _fetch_media(self):
+        # Runs on a pool thread
+        return self.api.get_videos(), self.api.get_images()
+
+    def _load_finished(self):
+        self._loading = False
+        self.refresh_btn.setEnabled(True)
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+
+    def _on_media_loaded(self, media):
+        # Runs as a Qt slot, where an escaping exception aborts the app
+        try:
+            videos, images = media
+            texts = ([f"VIDEO: {v.get('name')}" for v in videos] +
+                     [f"IMAGE: {i.get('name')}" for i in images])
+        except Exception as e:
+            self._on_media_failed(e)
+            return
+
         try:
-            for v in self.api.get_videos():
-                item = QListWidgetItem(f"VIDEO: {v.get('name')}")
-                self.media_list.addItem(item)
-            for i in self.api.get_images():
-                item = QListWidgetItem(f"IMAGE: {i.get('name')}")
-                self.media_list.addItem(item)
-        except:
-            pass
+            self.media_list.setUpdatesEnabled(False)
+            self.media_list.clear()
+            self.media_list.addItems(texts)
+        finally:
+            self.media_list.setUpdatesEnabled(True)
+            self._load_finished()
+
+    def _on_media_failed(self, error):
+        self._load_finished()
 
     def upload_video(self):
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Videos", "", "Video (*.mp4 *.mov *.avi *.mkv)"
         )
-        for f in files:
-            try:
-                self.api.upload_video(f)
-            except:
-                pass
-        self.refresh()
+        if files:
+            ApiWorker.start(lambda: self._upload_files(self.api.upload_video, files),
+                            self._on_upload_done)
 
     def upload_image(self):
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Images", "", "Images (*.png *.jpg *.jpeg *.gif)"
         )
+        if files:
+            ApiWorker.start(lambda: self._upload_files(self.api.upload_image, files),
+                            self._on_upload_done)
+
+    def _upload_files(self, upload, files):
+        # Runs on a pool thread
         for f in files:
             try:
-                self.api.upload_image(f)
+                upload(f)
             except:
                 pass
+
+    def _on_upload_done(self, _):
         self.refresh()
@@ -6,13 +6,17 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFrame, QListWidget, QListWidgetItem, QPushButton
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+
+from core.api_worker import ApiWorker
 
 
 class NDIView(QWidget):
     def __init__(self, api):
         super().__init__()
         self.api = api
+        self._loading = False  # A sources fetch is running on the thread pool
+        self._refresh_pending = False  # refresh() was called during that fetch
         self.init_ui()
 
     def init_ui(self):
@@ -63,48 +67,74 @@ NDI (Network Device Interface) allows video to be sent over your local network.
         self.refresh()
 
     def refresh(self):
-        self.sources_list.clear()
+        if self._loading:
+            # Run again once the current load lands, so results stay in order
+            self._refresh_pending = True
+            return
+        self._loading = True
+        ApiWorker.start(self.api.get_ndi_sources, self._on_sources_loaded,
+                        self._on_sources_failed)
+
+    def _load_finished(self):
+        self._loading = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh()
+
+    def _on_sources_loaded(self, sources):
+        # Runs as a Qt slot, where an escaping exception aborts the app
+        try:
+            rows = []
+            for source in sources or ():
+                name = source.get('name', 'Unknown')
+                address = source.get('address', 'Auto-discovered')
+                connected = source.get('connected', False)
+
+                status = "CONNECTED" if connected else "AVAILABLE"
+                rows.append((source, f"{name}\n{address} | {status}"))
+        except Exception as e:
+            self._on_sources_failed(e)
+            return
 
         try:
-            sources = self.api.get_ndi_sources()
+            self.sources_list.setUpdatesEnabled(False)
+            self.sources_list.clear()
 
-            if not sources:
+            if not rows:
                 item = QListWidgetItem("No NDI sources found. Click Refresh to discover.")
                 item.setForeground(Qt.gray)
                 self.sources_list.addItem(item)
                 return
 
-            for source in sources:
-                item = QListWidgetItem()
+            for source, text in rows:
+                item = QListWidgetItem(text)
                 item.setData(Qt.UserRole, source)
-
-                name = source.get('name', 'Unknown')
-                address = source.get('address', 'Auto-discovered')
-                connected = source.get('connected', False)
-
-                status = "CONNECTED" if connected else "AVAILABLE"
-                text = f"{name}\n{address} | {status}"
-                item.setText(text)
-
                 self.sources_list.addItem(item)
 
-        except Exception as e:
-            item = QListWidgetItem(f"Error: {e}")
-            item.setForeground(Qt.red)
-            self.sources_list.addItem(item)
+        finally:
+            self.sources_list.setUpdatesEnabled(True)
+            self._load_finished()
+
+    def _on_sources_failed(self, e):
+        self.sources_list.clear()
+        item = QListWidgetItem(f"Error: {e}")
+        item.setForeground(Qt.red)
+        self.sources_list.addItem(item)
+        self._load_finished()
 
     def refresh_sources(self):
         self.refresh_btn.setEnabled(False)
         self.refresh_btn.setText("REFRESHING...")
+        ApiWorker.start(self.api.refresh_ndi_sources, self._on_discovery_started,
+                        self._on_discovery_failed)
 
-        try:
-            self.api.refresh_ndi_sources()
-            # Wait a moment for discovery
-            from PyQt5.QtCore import QTimer
-            QTimer.singleShot(2000, self.on_refresh_complete)
-        except Exception as e:
-            print(f"Error refreshing NDI: {e}")
-            self.on_refresh_complete()
+    def _on_discovery_started(self, _):
+        # Wait a moment for discovery
+        QTimer.singleShot(2000, self.on_refresh_complete)
+
+    def _on_discovery_failed(self, e):
+        print(f"Error refreshing NDI: {e}")
+        self.on_refresh_complete()
 
     def on_refresh_complete(self):
         self.refresh_btn.setEnabled(True)
@@ -2,19 +2,105 @@
 Outputs View - Simplified layout
 """
 
+import logging
+from collections import namedtuple
+from functools import lru_cache, partial
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QListWidget, QListWidgetItem, QPushButton,
-    QDialog, QFormLayout, QSpinBox, QDoubleSpinBox,
+    QListView, QPushButton,
+    QDialog, QFormLayout, QSpinBox,
     QInputDialog, QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
+
+from core.api_client import APIError
+
+logger = logging.getLogger(__name__)
+
+Output = namedtuple('Output', 'id name type enabled settings')
+
+# Display text pieces, shared across rows and repaints
+_STATUS = {True: "ON", False: "OFF"}
+_upper = lru_cache(maxsize=64)(str.upper)
+
+
+def _to_output(d):
+    """Pull the fields the view uses out of an API output dict."""
+    if not isinstance(d, dict):
+        raise ValueError(f"Malformed output entry: {d!r}")
+    # Null fields become empty and type a str, so data() can't fail while painting
+    return Output(d.get('id'), d.get('name') or '', str(d.get('type') or ''),
+                  bool(d.get('enabled')), d.get('settings') or {})
+
+
+class OutputsModel(QAbstractListModel):
+    """List model over Output rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        output = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{output.name}  -  {_upper(output.type)}  -  {_STATUS[bool(output.enabled)]}"
+        if role == Qt.UserRole:
+            return output
+        return None
+
+    def set_rows(self, rows):
+        """Update to a new list of outputs, touching only the rows that changed."""
+        rows = list(rows)
+        new_ids = [output.id for output in rows]
+        if len(set(new_ids)) != len(new_ids):
+            self._reset(rows)  # Rows can't be matched up without unique ids
+            return
+
+        # Drop outputs that disappeared, bottom-up so row numbers stay valid
+        keep = set(new_ids)
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row].id not in keep:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+        # The survivors must still be in the server's order, else start over
+        old_ids = [output.id for output in self._rows]
+        known = set(old_ids)
+        if [i for i in new_ids if i in known] != old_ids:
+            self._reset(rows)
+            return
+
+        # Insert new outputs and refresh changed ones in place
+        for row, output in enumerate(rows):
+            if row < len(self._rows) and self._rows[row].id == output.id:
+                if self._rows[row] != output:
+                    self._rows[row] = output
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._rows.insert(row, output)
+                self.endInsertRows()
+
+    def _reset(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
 
 
 class OutputsView(QWidget):
-    def __init__(self, api):
+    def __init__(self, api, qt_api):
         super().__init__()
         self.api = api
+        self.qt_api = qt_api
+        self._edit_dialog = None  # Built on first edit, then reused
         self.init_ui()
 
     def init_ui(self):
@@ -42,23 +128,23 @@ class OutputsView(QWidget):
         layout.addLayout(header)
 
         # Outputs list
-        self.outputs_list = QListWidget()
-        self.outputs_list.itemDoubleClicked.connect(self.edit_output)
+        self.model = OutputsModel(self)
+        self.outputs_list = QListView()
+        self.outputs_list.setObjectName("outputsList")
+        self.outputs_list.setModel(self.model)
+        self.outputs_list.doubleClicked.connect(self.edit_output)
         layout.addWidget(self.outputs_list)
 
-        self.refresh()
+        # Fetch once the event loop runs so the tab paints first
+        QTimer.singleShot(0, self.refresh)
 
     def refresh(self):
-        self.outputs_list.clear()
         try:
-            for output in self.api.get_outputs():
-                status = "ON" if output.get('enabled') else "OFF"
-                text = f"{output.get('name')}  -  {output.get('type', '').upper()}  -  {status}"
-                item = QListWidgetItem(text)
-                item.setData(Qt.UserRole, output)
-                self.outputs_list.addItem(item)
-        except:
-            pass
+            rows = [_to_output(d) for d in self.api.get_outputs()]
+            self.model.set_rows(rows)
+        except (APIError, ValueError) as e:
+            self.model.set_rows([])
+            logger.debug("Failed to load outputs", exc_info=e)
 
     def add_ndi(self):
         name, ok = QInputDialog.getText(self, "Add NDI", "Name:")
@@ -66,8 +152,8 @@ class OutputsView(QWidget):
             try:
                 self.api.add_ndi_output(name)
                 self.refresh()
-            except:
-                pass
+            except (APIError, ValueError) as e:
+                logger.debug("Failed to add NDI output %r", name, exc_info=e)
 
     def add_display(self):
         """Add a physical display output."""
@@ -97,20 +183,21 @@ class OutputsView(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to add display: {e}")
 
-    def edit_output(self, item):
-        output = item.data(Qt.UserRole)
+    def edit_output(self, index):
+        output = index.data(Qt.UserRole)
         if output:
-            dlg = OutputDialog(self.api, output, self)
-            if dlg.exec_() == QDialog.Accepted:
+            if self._edit_dialog is None:
+                self._edit_dialog = OutputDialog(self.qt_api, self)
+            self._edit_dialog.set_output(output)
+            if self._edit_dialog.exec_() == QDialog.Accepted:
                 self.refresh()
 
 
 class OutputDialog(QDialog):
-    def __init__(self, api, output, parent=None):
+    def __init__(self, qt_api, parent=None):
         super().__init__(parent)
-        self.api = api
-        self.output = output
-        self.setWindowTitle(output.get('name', 'Output'))
+        self.qt_api = qt_api
+        self.output = None
         self.setMinimumWidth(400)
         self.init_ui()
 
@@ -121,26 +208,20 @@ class OutputDialog(QDialog):
         form = QFormLayout()
         form.setSpacing(12)
 
-        s = self.output.get('settings', {})
-
         self.x = QSpinBox()
         self.x.setRange(-9999, 9999)
-        self.x.setValue(s.get('x', 0))
         form.addRow("X:", self.x)
 
         self.y = QSpinBox()
         self.y.setRange(-9999, 9999)
-        self.y.setValue(s.get('y', 0))
         form.addRow("Y:", self.y)
 
         self.w = QSpinBox()
         self.w.setRange(1, 9999)
-        self.w.setValue(s.get('width', 1920))
         form.addRow("Width:", self.w)
 
         self.h = QSpinBox()
         self.h.setRange(1, 9999)
-        self.h.setValue(s.get('height', 1080))
         form.addRow("Height:", self.h)
 
         layout.addLayout(form)
@@ -148,9 +229,9 @@ class OutputDialog(QDialog):
         # Buttons
         btns = QHBoxLayout()
 
-        toggle_btn = QPushButton("DISABLE" if self.output.get('enabled') else "ENABLE")
-        toggle_btn.clicked.connect(self.toggle)
-        btns.addWidget(toggle_btn)
+        self.toggle_btn = QPushButton()
+        self.toggle_btn.clicked.connect(self.toggle)
+        btns.addWidget(self.toggle_btn)
 
         del_btn = QPushButton("DELETE")
         del_btn.setObjectName("danger")
@@ -166,31 +247,46 @@ class OutputDialog(QDialog):
 
         layout.addLayout(btns)
 
-    def toggle(self):
-        try:
-            if self.output.get('enabled'):
-                self.api.disable_output(self.output['id'])
-            else:
-                self.api.enable_output(self.output['id'])
+    def set_output(self, output):
+        """Show the given output's settings."""
+        self.output = output
+        self.setWindowTitle(output.name or 'Output')
+
+        s = output.settings or {}
+        self.x.setValue(s.get('x', 0))
+        self.y.setValue(s.get('y', 0))
+        self.w.setValue(s.get('width', 1920))
+        self.h.setValue(s.get('height', 1080))
+
+        self.toggle_btn.setText("DISABLE" if output.enabled else "ENABLE")
+
+    # Requests run asynchronously; the dialog closes once the server confirms
+
+    def _on_done(self, output, _result):
+        # A late reply for an earlier edit must not close the current one
+        if output is self.output:
             self.accept()
-        except:
-            pass
+
+    def _on_failed(self, action, output, error):
+        logger.debug("Failed to %s output %r: %s", action, output.id, error)
+
+    def toggle(self):
+        done = partial(self._on_done, self.output)
+        if self.output.enabled:
+            self.qt_api.disable_output(self.output.id, done,
+                                       partial(self._on_failed, 'disable', self.output))
+        else:
+            self.qt_api.enable_output(self.output.id, done,
+                                      partial(self._on_failed, 'enable', self.output))
 
     def delete(self):
-        try:
-            self.api.delete_output(self.output['id'])
-            self.accept()
-        except:
-            pass
+        self.qt_api.delete_output(self.output.id, partial(self._on_done, self.output),
+                                  partial(self._on_failed, 'delete', self.output))
 
     def save(self):
-        try:
-            self.api.update_output_settings(self.output['id'], {
-                'x': self.x.value(),
-                'y': self.y.value(),
-                'width': self.w.value(),
-                'height': self.h.value(),
-            })
-            self.accept()
-        except:
-            pass
+        self.qt_api.update_output_settings(self.output.id, {
+            'x': self.x.value(),
+            'y': self.y.value(),
+            'width': self.w.value(),
+            'height': self.h.value(),
+        }, partial(self._on_done, self.output), partial(self._on_failed, 'update', self.output))
@@ -4,10 +4,8 @@ Settings View - Simplified layout
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QCheckBox, QSpinBox,
-    QMessageBox, QScrollArea
+    QLineEdit, QPushButton, QCheckBox, QMessageBox
 )
-from PyQt5.QtCore import Qt
 
 
 class SettingsView(QWidget):
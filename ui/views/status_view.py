@@ -2,20 +2,46 @@
 Status View - System status and live preview
 """
 
+from functools import partial
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QGridLayout, QPushButton
+    QFrame
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import Qt, QTimer, QEvent, QBuffer, QByteArray, QUrl
+from PyQt5.QtGui import QPixmap, QImageReader
+from PyQt5.QtNetwork import QNetworkRequest
+
+from core.api_worker import ApiWorker
+
+
+def _decode_preview(data, size, smooth=False):
+    """Decode a preview frame at label size; runs on a pool thread, so QImage only."""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    reader = QImageReader(buffer)
+    frame_size = reader.size()
+    if frame_size.isValid():
+        # JPEG frames are scaled during decoding instead of after it
+        reader.setScaledSize(frame_size.scaled(size, Qt.KeepAspectRatio))
+        reader.setQuality(100 if smooth else 0)
+    return reader.read()
 
 
 class StatusView(QWidget):
-    def __init__(self, api):
+    def __init__(self, api, qt_api):
         super().__init__()
         self.api = api
+        self.qt_api = qt_api
+        # Shared with the other views so they all reuse the same connections
+        self.network_manager = qt_api.nam
+        self._status_pending = False  # A status fetch is running on the thread pool
+        self._inflight = None  # Pending preview reply; at most one at a time
+        self._preview_request = None  # Cached request for _preview_url_str
+        self._preview_url_str = None
+        self._decoding = False  # A frame is being decoded on the thread pool
+        self._last_frame = None  # Raw bytes of the newest frame, for the smooth re-scale
+        self._last_size = None  # Label size that frame was scaled to
         self.init_ui()
         self.start_updates()
 
@@ -31,6 +57,7 @@ class StatusView(QWidget):
         # Status cards
         cards_frame = QFrame()
         cards_frame.setObjectName("panel")
+        self.cards_frame = cards_frame
         cards_layout = QHBoxLayout(cards_frame)
         cards_layout.setSpacing(30)
 
@@ -66,14 +93,13 @@ class StatusView(QWidget):
             border-radius: 8px;
         """)
         preview_layout.addWidget(self.preview_label)
+        # Frames are scaled to this; kept current by eventFilter
+        self._preview_size = self.preview_label.size()
+        self.preview_label.installEventFilter(self)
 
         layout.addWidget(preview_frame)
         layout.addStretch()
 
-        # Network manager for preview images
-        self.network_manager = QNetworkAccessManager()
-        self.network_manager.finished.connect(self.on_preview_loaded)
-
     def create_status_card(self, label):
         card = QFrame()
         card_layout = QVBoxLayout(card)
@@ -92,45 +118,128 @@ class StatusView(QWidget):
         return card
 
     def start_updates(self):
-        self.update_timer = QTimer()
+        self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_status)
         self.update_timer.start(2000)
 
-        self.preview_timer = QTimer()
+        self.preview_timer = QTimer(self)
         self.preview_timer.timeout.connect(self.update_preview)
         self.preview_timer.start(100)  # 10 FPS preview
 
-        self.update_status()
+        # Frames stream with fast scaling; once they stop, redraw the last one smoothly
+        self.resmooth_timer = QTimer(self)
+        self.resmooth_timer.setSingleShot(True)
+        self.resmooth_timer.timeout.connect(self._resmooth)
+        # The first status fetch happens in showEvent
 
     def update_status(self):
+        if not self.isVisible() or self._status_pending:
+            return
+        self._status_pending = True
+        ApiWorker.start(self.api.get_status, self.on_status_loaded, self.on_status_failed)
+
+    def on_status_failed(self, error):
+        self._status_pending = False
+
+    def on_status_loaded(self, status):
+        self._status_pending = False
+
+        # Repaint the cards once for all five values
+        self.cards_frame.setUpdatesEnabled(False)
         try:
-            status = self.api.get_status()
-            self.status_cards['version'].value_label.setText(status.get('version', '-'))
-            self.status_cards['fixtures'].value_label.setText(str(status.get('fixtures', 0)))
-            self.status_cards['resolution'].value_label.setText(status.get('resolution', '-'))
-            self.status_cards['outputs'].value_label.setText(str(status.get('outputCount', 0)))
-            self.status_cards['fps'].value_label.setText(str(status.get('fps', 0)))
+            self._set(self.status_cards['version'].value_label, status.get('version', '-'))
+            self._set(self.status_cards['fixtures'].value_label, status.get('fixtures', 0))
+            self._set(self.status_cards['resolution'].value_label, status.get('resolution', '-'))
+            self._set(self.status_cards['outputs'].value_label, status.get('outputCount', 0))
+            self._set(self.status_cards['fps'].value_label, status.get('fps', 0))
         except Exception:
             pass
+        finally:
+            self.cards_frame.setUpdatesEnabled(True)
+
+    def _set(self, label, value):
+        # Unchanged text would still invalidate the label
+        text = str(value)
+        if label.text() != text:
+            label.setText(text)
 
     def update_preview(self):
+        if not self.isVisible():
+            return
+        # Skip this tick while the previous frame is still downloading or decoding
+        if self._decoding or (self._inflight is not None and not self._inflight.isFinished()):
+            return
         try:
-            url = QUrl(self.api.get_preview_url())
-            request = QNetworkRequest(url)
-            self.network_manager.get(request)
+            self._inflight = self.network_manager.get(self._get_preview_request())
+            self._inflight.finished.connect(partial(self.on_preview_loaded, self._inflight))
         except Exception:
             pass
 
+    def _get_preview_request(self):
+        # Rebuilt only when the server URL changes
+        url = self.api.preview_url
+        if url != self._preview_url_str:
+            request = QNetworkRequest(QUrl(url))
+            request.setAttribute(QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+            # Keep one socket for the 10 FPS stream; frames are already compressed
+            request.setRawHeader(b'Connection', b'keep-alive')
+            request.setRawHeader(b'Accept-Encoding', b'identity')
+            self._preview_request = request
+            self._preview_url_str = url
+        return self._preview_request
+
     def on_preview_loaded(self, reply):
+        if reply is self._inflight:
+            self._inflight = None
+        reply.deleteLater()
         if reply.error():
             return
 
-        data = reply.readAll()
-        pixmap = QPixmap()
-        if pixmap.loadFromData(data):
-            scaled = pixmap.scaled(
-                self.preview_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.preview_label.setPixmap(scaled)
+        data = bytes(reply.readAll())
+        size = self._preview_size
+        # A static scene republishes the same frame; what is shown is already current
+        if data == self._last_frame and size == self._last_size:
+            return
+
+        self._last_frame = data
+        self._last_size = size
+        self._decoding = True
+        ApiWorker.start(partial(_decode_preview, data, size),
+                        self.on_preview_decoded, self.on_preview_failed)
+        self.resmooth_timer.start(500)
+
+    def _resmooth(self):
+        if self._last_frame is None or self._decoding:
+            return
+        self._decoding = True
+        ApiWorker.start(partial(_decode_preview, self._last_frame, self._preview_size, True),
+                        self.on_preview_decoded, self.on_preview_failed)
+
+    def on_preview_decoded(self, image):
+        self._decoding = False
+        if not image.isNull():
+            self.preview_label.setPixmap(QPixmap.fromImage(image))
+
+    def on_preview_failed(self, error):
+        self._decoding = False
+
+    def eventFilter(self, obj, event):
+        if obj is self.preview_label and event.type() == QEvent.Resize:
+            self._preview_size = event.size()
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_timer.start()
+        self.preview_timer.start()
+        self.update_status()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Background tabs don't poll; drop any frame still in flight
+        self.update_timer.stop()
+        self.preview_timer.stop()
+        self.resmooth_timer.stop()
+        if self._inflight is not None:
+            self._inflight.abort()